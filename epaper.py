@@ -1,17 +1,19 @@
 from machine import SPI, Pin
+from micropython import const
 from epaper1in54 import EPD_1in54
 import time
 
 # --- Pin Configuration ---
-SCK = 6
-MOSI = 7
-CS = 5
-DC = 8
-RST = 9
-BUSY = 10
+SCK = const(6)
+MOSI = const(7)
+CS = const(5)
+DC = const(8)
+RST = const(9)
+BUSY = const(10)
 
 # --- Initialize SPI ---
-spi = SPI(0, baudrate=2000000, polarity=0, phase=0,
+# The SSD1681 accepts SCK up to 20 MHz; drop this if long wiring causes errors.
+spi = SPI(0, baudrate=20000000, polarity=0, phase=0,
           sck=Pin(SCK), mosi=Pin(MOSI))
 
 # --- Initialize e-Paper display ---
@@ -8,16 +8,148 @@ Enhanced version with:
 - LUT management
 - Dirty buffer optimization
 - Sleep and wake control
+- Non-blocking refresh (show(wait=False))
 - Inline documentation with datasheet links
 
+Orientation:
+- set_rotation() and set_flip() apply to drawing done afterwards through the
+  draw_*, load_pbm and draw_image methods. Content already drawn is not
+  re-oriented and the display is not marked dirty, so set_rotation(90)
+  followed by show() on its own changes nothing.
+- self.buffer and self.fb hold the frame in panel coordinates. Drawing
+  straight into self.fb (ellipse, blit, ...) ignores the orientation.
+- A net vertical flip at 0 or 180 degrees is done by the controller, and
+  self.buffer rows are then stored bottom-up.
+
 Datasheet: https://www.waveshare.com/wiki/1.54inch_e-Paper_Module
 """
 
 from machine import Pin, SPI
 import framebuf
+import micropython
+from micropython import const
 import time
 
-BUSY_TIMEOUT_MS = 5000  # Timeout for busy-wait in milliseconds
+BUSY_TIMEOUT_MS = const(5000)  # Timeout for busy-wait in milliseconds
+BUSY_POLL_US = const(500)  # Interval between BUSY pin polls in microseconds
+
+# Per-bit masks for MONO_HLSB pixels, indexed by x & 7
+_SET = (0x80, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02, 0x01)
+_CLR = (0x7F, 0xBF, 0xDF, 0xEF, 0xF7, 0xFB, 0xFD, 0xFE)
+
+# Bit-reversal table: mirrors the 8 pixels packed in one MONO_HLSB byte
+_BITREV = bytearray(256)
+for _i in range(256):
+    _b = 0
+    for _j in range(8):
+        if _i & (1 << _j):
+            _b |= 0x80 >> _j
+    _BITREV[_i] = _b
+del _i, _j, _b
+
+
+# Specialized flip/rotate kernels. Each copies the set pixels of a MONO_HLSB
+# buffer into a zeroed dst buffer at their transformed position. The name
+# gives the rotation and whether a horizontal flip is applied before it.
+# A vertical flip is a horizontal flip followed by a 180 degree rotation, and
+# at 0 and 180 degrees _update_xform hands net vertical flips to the
+# controller, so these five plus the identity cover every orientation.
+
+
+@micropython.viper
+def _xform_r0h(src: ptr8, dst: ptr8, w: int, h: int):
+    # (x, y) -> (w-1-x, y): reverse byte order per row and bits per byte
+    lut = ptr8(_BITREV)
+    w8 = w >> 3
+    for y in range(h):
+        row = y * w8
+        end = row + w8 - 1
+        for i in range(w8):
+            dst[end - i] = lut[src[row + i]]
+
+
+@micropython.viper
+def _xform_r90(src: ptr8, dst: ptr8, w: int, h: int):
+    # (x, y) -> (y, w-1-x)
+    w8 = w >> 3
+    for y in range(h):
+        row = y * w8
+        for x in range(w):
+            if (src[(x >> 3) + row] >> (7 - (x & 7))) & 1:
+                tx = y
+                i = (tx >> 3) + (w - 1 - x) * w8
+                dst[i] = dst[i] | (0x80 >> (tx & 7))
+
+
+@micropython.viper
+def _xform_r90h(src: ptr8, dst: ptr8, w: int, h: int):
+    # (x, y) -> (y, x)
+    w8 = w >> 3
+    for y in range(h):
+        row = y * w8
+        for x in range(w):
+            if (src[(x >> 3) + row] >> (7 - (x & 7))) & 1:
+                tx = y
+                i = (tx >> 3) + x * w8
+                dst[i] = dst[i] | (0x80 >> (tx & 7))
+
+
+@micropython.viper
+def _xform_r270(src: ptr8, dst: ptr8, w: int, h: int):
+    # (x, y) -> (h-1-y, x)
+    w8 = w >> 3
+    for y in range(h):
+        row = y * w8
+        for x in range(w):
+            if (src[(x >> 3) + row] >> (7 - (x & 7))) & 1:
+                tx = h - 1 - y
+                i = (tx >> 3) + x * w8
+                dst[i] = dst[i] | (0x80 >> (tx & 7))
+
+
+@micropython.viper
+def _xform_r270h(src: ptr8, dst: ptr8, w: int, h: int):
+    # (x, y) -> (h-1-y, w-1-x)
+    w8 = w >> 3
+    for y in range(h):
+        row = y * w8
+        for x in range(w):
+            if (src[(x >> 3) + row] >> (7 - (x & 7))) & 1:
+                tx = h - 1 - y
+                i = (tx >> 3) + (w - 1 - x) * w8
+                dst[i] = dst[i] | (0x80 >> (tx & 7))
+
+
+_KERNELS = {
+    (0, False): None,  # identity, show() sends the buffer as-is
+    (0, True): _xform_r0h,
+    (90, False): _xform_r90,
+    (90, True): _xform_r90h,
+    (270, False): _xform_r270,
+    (270, True): _xform_r270h,
+}
+
+# (rotation, flip_horizontal, flip_vertical) -> kernel, for the orientations
+# _update_xform can ask for once vertical flips at 0/180 degrees are removed
+_XFORM_TABLE = {}
+for _r in (0, 90, 180, 270):
+    for _h in (False, True):
+        for _v in (False, True):
+            _k = ((_r + 180) % 360, not _h) if _v else (_r, _h)
+            if _k in _KERNELS:
+                _XFORM_TABLE[(_r, _h, _v)] = _KERNELS[_k]
+del _r, _h, _v, _k
+
+
+def _reverse_rows(src, dst, w, h):
+    # Vertical flip, used when the data entry mode changes: whole rows move
+    # intact, so copy them natively.
+    w8 = w >> 3
+    src = memoryview(src)
+    for y in range(h):
+        o = (h - 1 - y) * w8
+        dst[o:o + w8] = src[y * w8:y * w8 + w8]
+
 
 class EPD_1in54:
     def __init__(self, spi, cs, dc, rst, busy, width=200, height=200):
@@ -29,55 +161,122 @@ class EPD_1in54:
         self.rst = Pin(rst, Pin.OUT)
         self.busy = Pin(busy, Pin.IN)
         self.spi = spi
+        self._tx1 = bytearray(1)  # Reused for single-byte transfers
+
+        # Start the hardware reset now and do the allocations below while
+        # RST is held low and while the controller comes out of reset.
+        self._reset_assert()
 
         self.buffer = bytearray(self.width * self.height // 8)
         self.fb = framebuf.FrameBuffer(self.buffer, self.width, self.height, framebuf.MONO_HLSB)
 
+        # Scratch frame, allocated once and reused by show() and image loading
+        self._xbuf = bytearray(len(self.buffer))
+
+        self._busy_pending = False  # Refresh started without waiting for BUSY
+
+        self._reset_release()
+
         self.flip_horizontal = False
         self.flip_vertical = False
         self.rotation = 0
+        self._xform_fn = None
+        self._m = (1, 0, 0, 0, 1, 0)  # Logical -> panel affine map, see _update_xform
+        self._entry_mode = 0x01  # Data entry mode: X increment, Y decrement
         self.dirty = False
+        self._dirty_box = None  # (x0, y0, x1, y1) inclusive, in panel coordinates
 
-        self.init()
+        self.init(reset=False)
 
     def reset(self):
         # Hardware reset sequence for the SSD1681 controller.
         # Pulling RST low then high ensures the controller resets correctly.
         # The 200ms delay is based on datasheet recommendations for stable reset.
+        self._reset_assert()
+        self._reset_release()
+        self._reset_settle()
+
+    def _reset_assert(self):
         self.rst.value(0)
-        time.sleep_ms(200)
+        self._rst_ticks = time.ticks_ms()
+
+    def _reset_release(self):
+        # Waits out whatever is left of the 200ms low phase, then releases RST.
+        self._wait_since_reset(200)
         self.rst.value(1)
-        time.sleep_ms(200)
+        self._rst_ticks = time.ticks_ms()
+
+    def _reset_settle(self):
+        # Waits out whatever is left of the 200ms after releasing RST.
+        self._wait_since_reset(200)
+
+    def _wait_since_reset(self, ms):
+        remaining = ms - time.ticks_diff(time.ticks_ms(), self._rst_ticks)
+        if remaining > 0:
+            time.sleep_ms(remaining)
 
     def send_cmd(self, cmd):
         # Sends a command byte to the display controller.
         # The D/C pin is set low for commands to distinguish them from data.
         # Refer to SSD1681 datasheet section 7.1 for interface control logic.
+        self.wait_idle()
+        self._tx1[0] = cmd
         self.dc.value(0)
         self.cs.value(0)
-        self.spi.write(bytearray([cmd]))
+        self.spi.write(self._tx1)
         self.cs.value(1)
 
     def send_data(self, data):
-        # Sends data byte(s) to the display controller.
+        # Sends data byte(s) to the display controller, accepting either an int
+        # or a buffer; the driver itself sends data through send_cmd_data.
         # The D/C pin is set high for data to differentiate it from commands.
+        self.wait_idle()
+        if isinstance(data, int):
+            self._tx1[0] = data
+            data = self._tx1
         self.dc.value(1)
         self.cs.value(0)
-        if isinstance(data, int):
-            self.spi.write(bytearray([data]))
-        else:
-            self.spi.write(data)
+        self.spi.write(data)
+        self.cs.value(1)
+
+    def send_cmd_data(self, cmd, data):
+        # Sends a command followed by its data in a single chip-select window.
+        # Only D/C is toggled between the two phases, saving a CS cycle.
+        self.wait_idle()
+        self._tx1[0] = cmd
+        self.cs.value(0)
+        self.dc.value(0)
+        self.spi.write(self._tx1)
+        self.dc.value(1)
+        self.spi.write(data)
         self.cs.value(1)
 
+    def wait_idle(self):
+        # Waits for a refresh left running by show(wait=False) to finish.
+        # Every command goes through here first, so callers rarely need it.
+        if self._busy_pending:
+            self._busy_pending = False
+            self.wait_busy()
+
+    def _start_refresh(self, partial):
+        self.send_cmd_data(0x22, b'\xF7' if not partial else b'\xFF')  # 0xFF = partial refresh waveform
+        self.send_cmd(0x20)
+        self._busy_pending = True
+
     def wait_busy(self, timeout_ms=BUSY_TIMEOUT_MS):
         start = time.ticks_ms()
         while self.busy.value() == 1:
             if time.ticks_diff(time.ticks_ms(), start) > timeout_ms:
                 raise RuntimeError("EPD busy timeout exceeded")
-            time.sleep_ms(50)
+            time.sleep_us(BUSY_POLL_US)
 
-    def init(self):
-        self.reset()
+    def init(self, reset=True):
+        # reset=False skips the reset pulse when one is already in progress,
+        # as started by __init__; the settle time is still honoured.
+        if reset:
+            self.reset()
+        else:
+            self._reset_settle()
         self.wait_busy()
 
         # SWRESET [datasheet 10.1.1]
@@ -85,108 +284,204 @@ class EPD_1in54:
         self.wait_busy()
 
         # Driver output control [datasheet 10.1.2]
-        self.send_cmd(0x01)
-        self.send_data(0xC7)  # 199
-        self.send_data(0x00)
-        self.send_data(0x00)
+        self.send_cmd_data(0x01, b'\xC7\x00\x00')  # 199
 
         # Data entry mode [datasheet 10.1.6]
-        self.send_cmd(0x11)
-        self.send_data(0x01)
+        self.send_cmd_data(0x11, bytes([self._entry_mode]))
 
         # Set RAM X-address [datasheet 10.1.7]
-        self.send_cmd(0x44)
-        self.send_data(0x00)
-        self.send_data((self.width // 8) - 1)
+        self.send_cmd_data(0x44, bytes([0x00, (self.width // 8) - 1]))
 
         # Set RAM Y-address [datasheet 10.1.8]
-        self.send_cmd(0x45)
-        self.send_data(0xC7)
-        self.send_data(0x00)
-        self.send_data(0x00)
-        self.send_data(0x00)
+        self.send_cmd_data(0x45, b'\xC7\x00\x00\x00')
 
-        self.send_cmd(0x3C)  # Border waveform
-        self.send_data(0x01)
+        self.send_cmd_data(0x3C, b'\x01')  # Border waveform
 
-        self.send_cmd(0x18)
-        self.send_data(0x80)
+        self.send_cmd_data(0x18, b'\x80')
 
-        self.send_cmd(0x22)  # Load LUT
-        self.send_data(0xB1)
+        self.send_cmd_data(0x22, b'\xB1')  # Load LUT
         self.send_cmd(0x20)
         self.wait_busy()
 
+    def _expand_box(self, x, y, w, h):
+        # Grows the dirty bounding box to cover the given rectangle, clipped to the screen.
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min(x + w, self.width) - 1
+        y1 = min(y + h, self.height) - 1
+        if x1 < x0 or y1 < y0:
+            return
+        box = self._dirty_box
+        if box is not None:
+            x0 = min(x0, box[0])
+            y0 = min(y0, box[1])
+            x1 = max(x1, box[2])
+            y1 = max(y1, box[3])
+        self._dirty_box = (x0, y0, x1, y1)
+
+    def _set_window(self, x0, y0, x1, y1):
+        # Sets the data entry mode, RAM window and address counter for the
+        # byte-aligned region covering pixels (x0, y0)-(x1, y1)
+        # [datasheet 10.1.6, 10.1.7, 10.1.8, 10.1.9].
+        # Mode 0x01 decrements Y, so buffer row 0 is RAM row height-1; mode
+        # 0x03 increments Y, which flips the image vertically in the controller.
+        mode = self._entry_mode
+        if mode & 0x02:
+            ys = y0
+            ye = y1
+        else:
+            ys = self.height - 1 - y0
+            ye = self.height - 1 - y1
+        self.send_cmd_data(0x11, bytes([mode]))
+        self.send_cmd_data(0x44, bytes([x0 >> 3, x1 >> 3]))
+        self.send_cmd_data(0x45, bytes([ys & 0xFF, ys >> 8, ye & 0xFF, ye >> 8]))
+        self.send_cmd_data(0x4E, bytes([x0 >> 3]))
+        self.send_cmd_data(0x4F, bytes([ys & 0xFF, ys >> 8]))
+
     def clear(self, color=0xFF):
-        for i in range(len(self.buffer)):
-            self.buffer[i] = color
+        # Any non-zero color clears to white, zero clears to black.
+        # FrameBuffer.fill runs natively and shares memory with self.buffer.
+        self.fb.fill(1 if color else 0)
+        self._expand_box(0, 0, self.width, self.height)
         self.dirty = True
-        self.show()
 
     def set_rotation(self, angle):
+        # Orientation applies to subsequent drawing; content already in the
+        # buffer stays where it is.
         assert angle in (0, 90, 180, 270)
         self.rotation = angle
-        self.dirty = True
+        self._update_xform()
 
     def set_flip(self, horizontal=False, vertical=False):
+        # Orientation applies to subsequent drawing, as with set_rotation().
         self.flip_horizontal = horizontal
         self.flip_vertical = vertical
+        self._update_xform()
+
+    def _update_xform(self):
+        # The buffer is kept in panel orientation and drawing calls are mapped
+        # into it, so show() never has to transform the whole frame.
+        # Full images are oriented with the kernel picked here; single pixels
+        # and shape corners go through the affine map
+        #   px = a*x + b*y + c, py = d*x + e*y + f
+        # which applies the flips first and then the rotation.
+        rot = self.rotation
+        fh = bool(self.flip_horizontal)
+        fv = bool(self.flip_vertical)
+
+        # The controller can reverse its Y address direction (data entry mode,
+        # command 0x11), which flips rows for free. Reversing X only reorders
+        # bytes, not the 8 pixels packed in each, and the address swap cannot
+        # transpose packed pixels, so everything else stays in software.
+        # At 0 and 180 degrees a net vertical flip is handed to the
+        # controller, leaving at most a horizontal flip to draw.
+        y_flip = rot in (0, 180) and fv != (rot == 180)
+        if y_flip:
+            rot, fh, fv = 0, fh != (rot == 180), False
+        self._xform_fn = _XFORM_TABLE[(rot, fh, fv)]
+
+        W1 = self.width - 1
+        H1 = self.height - 1
+        sx, ox = (-1, W1) if fh else (1, 0)
+        sy, oy = (-1, H1) if fv else (1, 0)
+        if rot == 90:
+            self._m = (0, sy, oy, -sx, 0, W1 - ox)
+        elif rot == 180:
+            self._m = (-sx, 0, W1 - ox, 0, -sy, H1 - oy)
+        elif rot == 270:
+            self._m = (0, -sy, H1 - oy, sx, 0, ox)
+        else:
+            self._m = (sx, 0, ox, 0, sy, oy)
+
+        mode = 0x03 if y_flip else 0x01
+        if mode != self._entry_mode:
+            # Reverse the rows already in the buffer so content drawn before the
+            # change keeps its place on the panel.
+            W = self.width
+            H = self.height
+            _reverse_rows(self.buffer, self._xbuf, W, H)
+            self.buffer[:] = self._xbuf
+            box = self._dirty_box
+            if box is not None:
+                self._dirty_box = (box[0], H - 1 - box[3], box[2], H - 1 - box[1])
+            self._entry_mode = mode
+
+    def _map(self, x, y):
+        # Maps a logical pixel to panel coordinates.
+        a, b, c, d, e, f = self._m
+        return a * x + b * y + c, d * x + e * y + f
+
+    def _map_rect(self, x, y, w, h):
+        # Maps a logical rectangle to the panel rectangle covering the same pixels.
+        x0, y0 = self._map(x, y)
+        x1, y1 = self._map(x + w - 1, y + h - 1)
+        return min(x0, x1), min(y0, y1), abs(x1 - x0) + 1, abs(y1 - y0) + 1
+
+    def _load_image(self, img_buf):
+        # Copies a full frame in logical orientation into the panel buffer.
+        xform = self._xform_fn
+        if xform is None:
+            self.buffer[:] = img_buf
+        else:
+            self.fb.fill(0)
+            xform(img_buf, self.buffer, self.width, self.height)
+        self._expand_box(0, 0, self.width, self.height)
         self.dirty = True
 
-    def show(self, partial=False):
+    def show(self, partial=False, wait=True):
+        # With wait=False, show() returns as soon as the refresh has started:
+        # the panel refreshes while the caller prepares the next frame, and
+        # the next driver command waits for BUSY first.
+        if wait:
+            self.wait_idle()
         if not self.dirty:
             return
 
-        # Transformation logic for the framebuffer:
-        # - This converts the logical framebuffer content based on flip and rotation settings.
-        # - Pixel-by-pixel transformation is applied to a temporary buffer used for display.
-        # - Horizontal flip inverts the x-axis; vertical flip inverts the y-axis.
-        # - Rotation swaps and reindexes x and y coordinates to rotate by 90, 180, or 270 degrees.
-
-        transformed = bytearray(len(self.buffer))
-        for y in range(self.height):
-            for x in range(self.width):
-                src_index = x // 8 + y * (self.width // 8)
-                src_bit = 7 - (x % 8)
-                pixel = (self.buffer[src_index] >> src_bit) & 0x01
-
-                tx, ty = x, y
-                if self.flip_horizontal:
-                    tx = self.width - 1 - tx
-                if self.flip_vertical:
-                    ty = self.height - 1 - ty
-
-                if self.rotation == 90:
-                    tx, ty = ty, self.width - 1 - tx
-                elif self.rotation == 180:
-                    tx, ty = self.width - 1 - tx, self.height - 1 - ty
-                elif self.rotation == 270:
-                    tx, ty = self.height - 1 - ty, tx
-
-                dst_index = tx // 8 + ty * (self.width // 8)
-                dst_bit = 7 - (tx % 8)
-
-                if pixel:
-                    transformed[dst_index] |= (1 << dst_bit)
-                else:
-                    transformed[dst_index] &= ~(1 << dst_bit)
-
-        self.send_cmd(0x24)  # Write RAM
-        self.send_data(transformed)
-
-        self.send_cmd(0x22)
-        self.send_data(0xF7 if not partial else 0xFF)  # 0xFF = partial refresh waveform
-        self.send_cmd(0x20)
-        self.wait_busy()
+        # The buffer is already in panel orientation: flips and rotation are
+        # applied by the drawing methods, so it is sent without transformation.
+
+        # Attribute lookups are dict lookups in MicroPython; load them once.
+        W = self.width
+        H = self.height
+        buf = self.buffer
+        box = self._dirty_box
+
+        if partial and box is not None:
+            # Partial refresh: only send the dirty rectangle.
+            x0, y0, x1, y1 = box
+            w8 = W >> 3
+            xb0 = x0 >> 3
+            n = (x1 >> 3) - xb0 + 1
+            src = memoryview(buf)
+            if n == w8:
+                data = src[y0 * w8:(y1 + 1) * w8]
+            else:
+                # Gather the byte columns of each dirty row into the scratch frame.
+                data = memoryview(self._xbuf)[:n * (y1 - y0 + 1)]
+                o = 0
+                for y in range(y0, y1 + 1):
+                    i = y * w8 + xb0
+                    data[o:o + n] = src[i:i + n]
+                    o += n
+            self._set_window(x0, y0, x1, y1)
+        else:
+            data = buf
+            self._set_window(0, 0, W - 1, H - 1)
+
+        self.send_cmd_data(0x24, data)  # Write RAM
+        self._start_refresh(partial)
 
         self.dirty = False
+        self._dirty_box = None
+        if wait:
+            self.wait_idle()
 
     def sleep(self):
-        self.send_cmd(0x10)
-        self.send_data(0x01)
+        self.send_cmd_data(0x10, b'\x01')
 
     def wake(self):
         self.init()
+        self._expand_box(0, 0, self.width, self.height)
         self.dirty = True
 
     def load_pbm(self, filepath):
@@ -201,32 +496,84 @@ class EPD_1in54:
             w, h = [int(i) for i in line.strip().split()]
             if w != self.width or h != self.height:
                 raise ValueError("Image size mismatch")
-            self.buffer[:] = f.read(self.width * self.height // 8)
-        self.dirty = True
+            # Read straight into the destination frame so no temporary bytes
+            # object of the full image size is allocated.
+            expected = self.width * self.height // 8
+            if self._xform_fn is None:
+                target = self.buffer
+            else:
+                target = self._xbuf
+            if f.readinto(target) != expected:
+                raise ValueError("Truncated PBM image data")
+        if target is self.buffer:
+            self._expand_box(0, 0, self.width, self.height)
+            self.dirty = True
+        else:
+            self._load_image(target)
 
     def load_lut(self, lut_data):
-        self.send_cmd(0x32)
-        self.send_data(lut_data)
+        self.send_cmd_data(0x32, lut_data)
 
     def draw_text(self, x, y, text, color=0):
-        self.fb.text(text, x, y, color)
+        if not text:
+            return
+        tw = len(text) * 8
+        if self._xform_fn is None:
+            self.fb.text(text, x, y, color)
+        else:
+            # Glyphs cannot be drawn rotated, so render the text upright into a
+            # small scratch frame and map only its set pixels onto the panel.
+            tbuf = bytearray(tw)
+            tfb = framebuf.FrameBuffer(tbuf, tw, 8, framebuf.MONO_HLSB)
+            tfb.text(text, 0, 0, 1)
+            a, b, c, d, e, f = self._m
+            W = self.width
+            H = self.height
+            w8 = W >> 3
+            buf = self.buffer
+            n = len(text)
+            for ty in range(8):
+                row = ty * n
+                ly = y + ty
+                for tx in range(tw):
+                    if tbuf[row + (tx >> 3)] & _SET[tx & 7]:
+                        lx = x + tx
+                        px = a * lx + b * ly + c
+                        py = d * lx + e * ly + f
+                        if 0 <= px < W and 0 <= py < H:
+                            i = (px >> 3) + py * w8
+                            if color:
+                                buf[i] |= _SET[px & 7]
+                            else:
+                                buf[i] &= _CLR[px & 7]
+        self._expand_box(*self._map_rect(x, y, tw, 8))
         self.dirty = True
 
     def draw_rect(self, x, y, w, h, color=0):
+        if w <= 0 or h <= 0:
+            return
+        x, y, w, h = self._map_rect(x, y, w, h)
         self.fb.rect(x, y, w, h, color)
+        self._expand_box(x, y, w, h)
         self.dirty = True
 
     def draw_fill_rect(self, x, y, w, h, color=0):
+        if w <= 0 or h <= 0:
+            return
+        x, y, w, h = self._map_rect(x, y, w, h)
         self.fb.fill_rect(x, y, w, h, color)
+        self._expand_box(x, y, w, h)
         self.dirty = True
 
     def draw_line(self, x1, y1, x2, y2, color=0):
+        x1, y1 = self._map(x1, y1)
+        x2, y2 = self._map(x2, y2)
         self.fb.line(x1, y1, x2, y2, color)
+        self._expand_box(min(x1, x2), min(y1, y2), abs(x2 - x1) + 1, abs(y2 - y1) + 1)
         self.dirty = True
 
     def draw_image(self, img_buf):
         if len(img_buf) != len(self.buffer):
             raise ValueError("Image buffer size mismatch")
-        self.buffer[:] = img_buf
-        self.dirty = True
+        self._load_image(img_buf)
 